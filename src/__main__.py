@@ -1,10 +1,14 @@
+import atexit
+
+import pygame
+
 from .game import Game
 
 
 def main() -> None:
-    game: Game
-    with Game() as game:
-        game.run()
+    game: Game = Game()
+    atexit.register(pygame.quit)
+    game.run()
 
 
 if __name__ == "__main__":
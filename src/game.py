@@ -1,40 +1,67 @@
 from __future__ import annotations
 
-from collections.abc import Generator
-from enum import Flag, auto
-from random import randint
-from typing import ClassVar, Self
+from collections import deque
+from collections.abc import Callable, Generator
+from enum import IntEnum
+from random import randrange
+from typing import ClassVar
 
 import pygame
 
+EventHandler = Callable[[pygame.event.Event], None]
+
+
+class ChunkField:
+    __slots__ = ("_origin_x", "_origin_y", "game", "positions", "surfaces")
 
-class Chunk:
     BLOCK_SIZE: ClassVar[int] = 8
     CHUNK_SIZE: ClassVar[int] = BLOCK_SIZE * 8
 
     def __init__(self, game: Game) -> None:
         self.game: Game = game
 
-        self.surface: pygame.Surface = pygame.Surface(
+        # Chunk offsets (relative to the screen centre) and their surfaces are
+        # kept in parallel lists so rendering is a single batched blit.
+        self.positions: list[tuple[int, int]] = []
+        self.surfaces: list[pygame.Surface] = []
+
+        self._origin_x: int = game.rect.centerx - self.CHUNK_SIZE // 2
+        self._origin_y: int = game.rect.centery - self.CHUNK_SIZE // 2
+
+        self.add((0, 0))
+
+    def add(self, position: tuple[int, int]) -> None:
+        surface: pygame.Surface = pygame.Surface(
             (self.CHUNK_SIZE, self.CHUNK_SIZE)
-        )
-        self.surface.fill((255, 255, 255))
-
-    def render(self) -> None:
-        self.game.surface.blit(
-            self.surface,
-            (
-                self.game.camera_position.x
-                + self.game.rect.centerx
-                - self.CHUNK_SIZE / 2,
-                self.game.camera_position.y
-                + self.game.rect.centery
-                - self.CHUNK_SIZE / 2,
-            ),
-        )
+        ).convert()
+        surface.fill((255, 255, 255))
+
+        self.positions.append(position)
+        self.surfaces.append(surface)
+
+    def render(self) -> list[pygame.Rect]:
+        offset_x: float = self.game._cam_x + self._origin_x
+        offset_y: float = self.game._cam_y + self._origin_y
+
+        seq: list[tuple[pygame.Surface, tuple[float, float]]] = [
+            (s, (x + offset_x, y + offset_y))
+            for s, (x, y) in zip(self.surfaces, self.positions)
+        ]
+
+        # Use the rects blit reports: they match where it drew and are clipped.
+        return self.game.surface.blits(seq) or []
 
 
 class TextBox:
+    __slots__ = (
+        "_bg_cache",
+        "_cache",
+        "_order",
+        "font",
+        "position",
+        "surface",
+    )
+
     BG: ClassVar[tuple[int, int, int, int]] = (0, 0, 0, 100)
     FG: ClassVar[tuple[int, int, int, int]] = (255, 255, 255, 255)
 
@@ -43,6 +70,8 @@ class TextBox:
 
     PADDING: ClassVar[tuple[int, int]] = (15, 5)
 
+    CACHE_SIZE: ClassVar[int] = 64
+
     def __init__(self, surface: pygame.Surface, position: tuple[int, int]) -> None:
         self.font: pygame.font.Font = pygame.font.SysFont(
             self.FONT_FAMILY, self.FONT_SIZE
@@ -50,65 +79,135 @@ class TextBox:
         self.position: tuple[int, int] = position
         self.surface: pygame.Surface = surface
 
+        self._cache: dict[str, pygame.Surface] = {}
+        self._order: deque[str] = deque()
+
+        self._bg_cache: tuple[int, int, pygame.Surface] | None = None
+
     def __iter__(self) -> Generator[str]:
         yield from ()
 
     def _get_background(self, x: int, y: int) -> pygame.Surface:
+        if self._bg_cache is not None and self._bg_cache[:2] == (x, y):
+            return self._bg_cache[2]
+
         surface: pygame.Surface = pygame.Surface(
-            (self.PADDING[0] * 2 + x, self.PADDING[1] * 2 + y)
-        )
+            (self.PADDING[0] * 2 + x, self.PADDING[1] * 2 + y), pygame.SRCALPHA
+        ).convert_alpha()
         surface.fill(self.BG)
-        surface.set_alpha(self.BG[-1])
+
+        self._bg_cache = (x, y, surface)
         return surface
 
-    def _get_foreground(self) -> Generator[pygame.Surface]:
-        text: str
-        for text in self:
-            surface: pygame.Surface = self.font.render(text, 1, self.FG)
-            surface.set_alpha(self.FG[-1])
-            yield surface
+    def _render_line(self, text: str) -> pygame.Surface:
+        surface: pygame.Surface | None = self._cache.get(text)
+        if surface is None:
+            surface = self.font.render(text, 1, self.FG).convert_alpha()
+
+            self._cache[text] = surface
+            self._order.append(text)
+            if len(self._order) > self.CACHE_SIZE:
+                del self._cache[self._order.popleft()]
 
-    def render(self) -> None:
-        fg: tuple[pygame.Surface, ...] = tuple(self._get_foreground())
+        return surface
+
+    def _get_blits(
+        self, position: tuple[int, int]
+    ) -> list[tuple[pygame.Surface, tuple[int, int]]]:
+        fg: list[pygame.Surface] = [self._render_line(text) for text in self]
         lh: int = fg[0].get_height()
 
         bg: pygame.Surface = self._get_background(
-            max(x.get_width() for x in fg), lh * len(fg)
+            max([s.get_width() for s in fg]), lh * len(fg)
         )
 
-        x: int = self.PADDING[0] + self.position[0]
-        y: int = self.PADDING[1] + self.position[1]
+        x: int = self.PADDING[0] + position[0]
+        y: int = self.PADDING[1] + position[1]
 
-        blits: Generator[tuple[pygame.Surface, tuple[int, int]]] = (
-            (b, (x, lh * a + y)) for a, b in enumerate(fg)
-        )
-        self.surface.blits(((bg, self.position), *blits))
+        seq: list[tuple[pygame.Surface, tuple[int, int]]] = [(bg, position)]
+        surface: pygame.Surface
+        for surface in fg:
+            seq.append((surface, (x, y)))
+            y += lh
+        return seq
+
+    def _blit(self, seq: list[tuple[pygame.Surface, tuple[int, int]]]) -> pygame.Rect:
+        self.surface.blits(seq, doreturn=False)
+        return seq[0][0].get_rect(topleft=self.position)
+
+    def render(self) -> pygame.Rect:
+        return self._blit(self._get_blits(self.position))
 
 
 class AlertTextBox(TextBox):
+    __slots__ = ("_blits",)
+
+    def __init__(self, surface: pygame.Surface, position: tuple[int, int]) -> None:
+        super().__init__(surface, position)
+
+        self._blits: list[tuple[pygame.Surface, tuple[int, int]]] = self._get_blits(
+            position
+        )
+
     def __iter__(self) -> Generator[str]:
         yield "Try your mouse buttons!"
 
+    def render(self) -> pygame.Rect:
+        return self._blit(self._blits)
+
 
 class DebugTextBox(TextBox):
+    __slots__ = ("_blits", "game")
+
     def __init__(self, game: Game, position: tuple[int, int]) -> None:
         self.game: Game = game
         super().__init__(game.surface, position)
 
+        self._blits: list[tuple[pygame.Surface, tuple[int, int]]] | None = None
+
     def __iter__(self) -> Generator[str]:
         yield f"Camera position: {self.game.camera_position}"
         yield f"Mouse position: {self.game.mouse_position}"
-        yield f"Event mode: {self.game.mode}"
+        yield f"Event mode: Mode.{self.game.mode.name}"
 
+    def render(self) -> pygame.Rect:
+        if self.game._debug_dirty or self._blits is None:
+            self._blits = self._get_blits(self.position)
+            self.game._debug_dirty = False
 
-class Mode(Flag):
-    DRAG = auto()
-    NONE = auto()
+        return self._blit(self._blits)
+
+
+class Mode(IntEnum):
+    NONE = 0
+    DRAG = 1
 
 
 class Game:
+    __slots__ = (
+        "_cam_x",
+        "_cam_y",
+        "_debug_dirty",
+        "_dirty_rects",
+        "_event_dispatch",
+        "_keydown_dispatch",
+        "_mouse_x",
+        "_mouse_y",
+        "_mousebuttondown_dispatch",
+        "_mousebuttonup_dispatch",
+        "_redraw",
+        "alert",
+        "chunks",
+        "clock",
+        "color",
+        "debug",
+        "mode",
+        "rect",
+        "running",
+        "surface",
+    )
+
     FRAMERATE: ClassVar[int] = 60
-    ZERO: pygame.Vector2 = pygame.Vector2((0, 0))
 
     SCREEN_NAME: ClassVar[str] = "Middle Earth"
     SCREEN_SIZE: ClassVar[tuple[int, int]] = (1280, 780)
@@ -118,11 +217,18 @@ class Game:
 
         self.running: bool = False
         self.mode: Mode = Mode.NONE
+        self._debug_dirty: bool = True
 
-        self.camera_position: pygame.Vector2 = self.ZERO.copy()
-        self.mouse_position: pygame.Vector2 = self.ZERO.copy()
+        # Everything drawn last frame lies within these rects, so erasing them
+        # restores a clean background. ``_redraw`` forces a full repaint.
+        self._dirty_rects: list[pygame.Rect] = []
+        self._redraw: bool = True
+
+        self._cam_x: float = 0.0
+        self._cam_y: float = 0.0
+        self._mouse_x: float = 0.0
+        self._mouse_y: float = 0.0
 
-    def __enter__(self) -> Self:
         pygame.init()
         pygame.display.set_caption(self.SCREEN_NAME)
 
@@ -134,75 +240,129 @@ class Game:
         self.alert: TextBox = AlertTextBox(self.surface, (10, 80))
         self.debug: TextBox = DebugTextBox(self, (10, 10))
 
-        self.chunk: Chunk = Chunk(self)
-
-        return self
-
-    def __exit__(self, *_) -> None:
-        pygame.quit()
+        self.chunks: ChunkField = ChunkField(self)
+
+        self._event_dispatch: dict[int, EventHandler] = {
+            pygame.KEYDOWN: self.handle_keydown,
+            pygame.QUIT: self.handle_quit,
+            pygame.MOUSEBUTTONDOWN: self.handle_mousebuttondown,
+            pygame.MOUSEBUTTONUP: self.handle_mousebuttonup,
+            pygame.MOUSEMOTION: self.handle_mousemotion,
+            pygame.WINDOWEXPOSED: self.handle_expose,
+        }
+        self._keydown_dispatch: dict[int, EventHandler] = {
+            pygame.K_ESCAPE: self.handle_quit,
+        }
+        self._mousebuttondown_dispatch: dict[tuple[Mode, int], EventHandler] = {
+            (Mode.NONE, pygame.BUTTON_LEFT): self.handle_color,
+            (Mode.NONE, pygame.BUTTON_RIGHT): self.handle_camera_reset,
+            (Mode.NONE, pygame.BUTTON_MIDDLE): self.handle_drag_start,
+        }
+        self._mousebuttonup_dispatch: dict[tuple[Mode, int], EventHandler] = {
+            (Mode.DRAG, pygame.BUTTON_MIDDLE): self.handle_drag_stop,
+        }
+
+    @property
+    def camera_position(self) -> pygame.Vector2:
+        return pygame.Vector2(self._cam_x, self._cam_y)
+
+    @property
+    def mouse_position(self) -> pygame.Vector2:
+        return pygame.Vector2(self._mouse_x, self._mouse_y)
 
     def frame(self) -> None:
         self.handle_events()
-        self.surface.fill(self.color)
-
-        self.chunk.render()
-        self.alert.render()
-        self.debug.render()
-
-        pygame.display.flip()
+        if not self.running:
+            return
+
+        surface: pygame.Surface = self.surface
+        color: tuple[int, int, int] = self.color
+
+        rect: pygame.Rect
+        if self._redraw:
+            surface.fill(color)
+        else:
+            fill = surface.fill
+            for rect in self._dirty_rects:
+                fill(color, rect)
+
+        rects: list[pygame.Rect] = [
+            *self.chunks.render(),
+            self.alert.render(),
+            self.debug.render(),
+        ]
+
+        if self._redraw:
+            pygame.display.flip()
+            self._redraw = False
+        else:
+            pygame.display.update(self._dirty_rects + rects)
+
+        self._dirty_rects = rects
         self.clock.tick(self.FRAMERATE)
 
     def handle_events(self) -> None:
+        dispatch: Callable[[int], EventHandler | None] = self._event_dispatch.get
+
         event: pygame.event.Event
+        handler: EventHandler | None
         for event in pygame.event.get():
-            self.handle_event(event)
-
-    def handle_event(self, event: pygame.event.Event) -> None:
-        match event.type:
-            case pygame.KEYDOWN:
-                self.handle_keydown(event)
+            handler = dispatch(event.type)
+            if handler is not None:
+                handler(event)
+                if not self.running:
+                    return
 
-            case pygame.QUIT:
-                self.running = False
+    def handle_quit(self, event: pygame.event.Event) -> None:
+        self.running = False
 
-            case pygame.MOUSEBUTTONDOWN:
-                self.handle_mousebuttondown(event)
-
-            case pygame.MOUSEBUTTONUP:
-                self.handle_mousebuttonup(event)
-
-            case pygame.MOUSEMOTION:
-                self.handle_mousemotion(event)
+    def handle_expose(self, event: pygame.event.Event) -> None:
+        self._redraw = True
 
     def handle_keydown(self, event: pygame.event.Event) -> None:
-        match (self.mode, event.key):
-            case (_, pygame.K_ESCAPE):
-                self.running = False
+        handler: EventHandler | None = self._keydown_dispatch.get(event.key)
+        if handler is not None:
+            handler(event)
 
     def handle_mousebuttondown(self, event: pygame.event.Event) -> None:
-        match (self.mode, event.button):
-            case (Mode.NONE, pygame.BUTTON_LEFT):
-                self.color = get_color()
+        handler: EventHandler | None = self._mousebuttondown_dispatch.get(
+            (self.mode, event.button)
+        )
+        if handler is not None:
+            handler(event)
 
-            case (Mode.NONE, pygame.BUTTON_RIGHT):
-                self.camera_position = self.ZERO.copy()
+    def handle_mousebuttonup(self, event: pygame.event.Event) -> None:
+        handler: EventHandler | None = self._mousebuttonup_dispatch.get(
+            (self.mode, event.button)
+        )
+        if handler is not None:
+            handler(event)
 
-            case (Mode.NONE, pygame.BUTTON_MIDDLE):
-                self.mode = Mode.DRAG
+    def handle_color(self, event: pygame.event.Event) -> None:
+        self.color = get_color()
+        self._redraw = True
 
-    def handle_mousebuttonup(self, event: pygame.event.Event) -> None:
-        match (self.mode, event.button):
-            case (Mode.DRAG, pygame.BUTTON_MIDDLE):
-                self.mode = Mode.NONE
+    def handle_camera_reset(self, event: pygame.event.Event) -> None:
+        self._cam_x = self._cam_y = 0.0
+        self._debug_dirty = True
 
-    def handle_mousemotion(self, event: pygame.event.Event) -> None:
-        position: pygame.Vector2 = pygame.Vector2(event.pos)
+    def handle_drag_start(self, event: pygame.event.Event) -> None:
+        self.mode = Mode.DRAG
+        self._debug_dirty = True
+
+    def handle_drag_stop(self, event: pygame.event.Event) -> None:
+        self.mode = Mode.NONE
+        self._debug_dirty = True
 
-        match (self.mode, event.buttons):
-            case (Mode.DRAG, _):
-                self.camera_position += position - self.mouse_position
+    def handle_mousemotion(self, event: pygame.event.Event) -> None:
+        self._debug_dirty = True
+        if self.mode is not Mode.DRAG:
+            self._mouse_x, self._mouse_y = event.pos
+            return
 
-        self.mouse_position = position
+        self._cam_x += event.pos[0] - self._mouse_x
+        self._cam_y += event.pos[1] - self._mouse_y
+        self._mouse_x, self._mouse_y = event.pos
 
     def run(self) -> None:
         self.running = True
@@ -211,4 +371,6 @@ class Game:
 
 
 def get_color() -> tuple[int, int, int]:
-    return (randint(0, 160), randint(0, 160), randint(0, 160))
+    # One draw over all 161 ** 3 colours, split into base-161 digits.
+    n: int = randrange(161**3)
+    return (n % 161, n // 161 % 161, n // 25921)